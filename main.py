@@ -40,6 +40,12 @@ Examples:
 
   # Custom grid size
   %(prog)s video.mp4 -g 4x4
+
+  # Use hardware decoding when available
+  %(prog)s video.mp4 --hwaccel auto
+
+  # Limit FFmpeg to 2 decoder threads per video when running 4 workers
+  %(prog)s /path/to/videos/ --workers 4 --decode-threads 2
 """,
     )
 
@@ -103,6 +109,24 @@ Examples:
         help="Skip videos that already have a thumbnail.",
     )
 
+    # Hardware decoding
+    parser.add_argument(
+        "--hwaccel",
+        default=None,
+        metavar="DEVICE",
+        help="Hardware decoding device type (e.g. cuda, vaapi, videotoolbox, auto). "
+        "Falls back to software decoding if unavailable.",
+    )
+
+    # Decoder threads
+    parser.add_argument(
+        "--decode-threads",
+        type=int,
+        default=0,
+        metavar="N",
+        help="FFmpeg decoder threads per video. Default: 0 (auto).",
+    )
+
     # Verbose
     parser.add_argument(
         "-v", "--verbose", action="store_true", help="Enable verbose (debug) logging."
@@ -154,6 +178,8 @@ Examples:
             skip_existing=args.skip_existing,
             logger=logger,
             verbose=args.verbose,
+            hwaccel=args.hwaccel,
+            decode_threads=args.decode_threads,
         )
     elif is_file:
         # Single file mode (backward compatible)
@@ -164,6 +190,8 @@ Examples:
             max_width=args.max_width,
             logger=logger,
             verbose=args.verbose,
+            hwaccel=args.hwaccel,
+            decode_threads=args.decode_threads,
         )
     else:
         logger.error(f"Input path is neither a file nor directory: {input_path}")
@@ -177,6 +205,8 @@ def run_single_file(
     max_width: int,
     logger,
     verbose: bool = False,
+    hwaccel: str = None,
+    decode_threads: int = 0,
 ) -> int:
     """Process a single video file."""
     # Validate file
@@ -195,7 +225,13 @@ def run_single_file(
     # Generate thumbnail
     logger.info(f"Generating thumbnail for: {input_path}")
 
-    thumbr = Thumbr(grid_size=grid_size, max_width=max_width, logger=logger)
+    thumbr = Thumbr(
+        grid_size=grid_size,
+        max_width=max_width,
+        logger=logger,
+        hwaccel=hwaccel,
+        decode_threads=decode_threads,
+    )
 
     try:
         result = thumbr.generate_thumbnail_safe(input_path, output_path, max_width)
@@ -230,6 +266,8 @@ def run_batch_processing(
     skip_existing: bool,
     logger,
     verbose: bool = False,
+    hwaccel: str = None,
+    decode_threads: int = 0,
 ) -> int:
     """Process multiple videos in batch mode."""
     # Validate output directory
@@ -270,6 +308,8 @@ def run_batch_processing(
             output_dir=output_dir,
             logger=logger,
             verbose=verbose,
+            hwaccel=hwaccel,
+            decode_threads=decode_threads,
         )
 
         # Print final status (summary already shown by BatchProgressDisplay)
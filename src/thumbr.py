@@ -1,14 +1,18 @@
 import av
+import itertools
 import logging
 import numpy as np
+import PIL
 from PIL import Image, ImageDraw, ImageFont
 import os
+import queue
+import re
 import signal
 import threading
 import time
 from pathlib import Path
-from typing import Tuple, List, Optional, Dict, Any, Callable
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Tuple, List, Optional, Dict, Any, Callable, Iterable, Iterator
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
 from dataclasses import dataclass
 from tqdm import tqdm
 
@@ -46,6 +50,33 @@ signal.signal(signal.SIGINT, _signal_handler)
 signal.signal(signal.SIGTERM, _signal_handler)
 
 
+# Characters that are not letters, digits or underscores
+_SANITIZE_RE = re.compile(r"\W")
+
+
+def _safe_filename(video_path: str) -> str:
+    """Get the video's file stem with every non-word character replaced by "_".
+
+    Args:
+        video_path: Path to the video file.
+
+    Returns:
+        Sanitized file stem for use in output file names.
+    """
+    return _SANITIZE_RE.sub("_", Path(video_path).stem)
+
+
+# Steps reported while generating a single thumbnail
+THUMBNAIL_STEPS = (
+    "Getting video information",
+    "Calculating dimensions",
+    "Capturing and processing frames",
+    "Adding info section",
+    "Adding watermark",
+    "Saving thumbnail",
+)
+
+
 @dataclass
 class ThumbnailResult:
     """Result of thumbnail generation for a single video."""
@@ -66,6 +97,10 @@ class Thumbr:
         resize_frames_at_capture: bool = True,
         max_resize_dimension: int = 640,
         verbose: bool = False,
+        hwaccel: Optional[str] = None,
+        jpeg_quality: int = 50,
+        decode_threads: int = 0,
+        snap_to_keyframes: bool = False,
     ):
         """Initialize the thumbnailer with grid configuration.
 
@@ -78,6 +113,21 @@ class Thumbr:
                                       to reduce memory footprint.
             max_resize_dimension: Maximum dimension when resizing frames.
             verbose: If True, show detailed progress during thumbnail generation.
+            hwaccel: Optional hardware decoding device type (e.g. "cuda",
+                     "vaapi", "videotoolbox"), or "auto" to use the first
+                     device supported by FFmpeg. Falls back to software
+                     decoding when the device is unavailable.
+            jpeg_quality: JPEG quality (1-95) used when saving .jpg/.jpeg
+                          thumbnails.
+            decode_threads: Number of FFmpeg decoder threads per video.
+                            0 lets FFmpeg pick based on the CPU count.
+            snap_to_keyframes: If True, sample the keyframe at or before each
+                               target time of long videos instead of decoding
+                               up to the exact frame. Timestamps then show
+                               the keyframe time. Where keyframes are too
+                               sparse (the keyframe was already used or lies
+                               more than one sample interval before the
+                               target), the exact frame is decoded instead.
         """
         self.grid_size = grid_size
         self.total_frames = grid_size[0] * grid_size[1]
@@ -85,18 +135,49 @@ class Thumbr:
         self.resize_frames_at_capture = resize_frames_at_capture
         self.max_resize_dimension = max_resize_dimension
         self.verbose = verbose
+        self.hwaccel = hwaccel
+        self.jpeg_quality = jpeg_quality
+        self.decode_threads = decode_threads
+        self.snap_to_keyframes = snap_to_keyframes
 
         # Initialize fonts with cross-platform fallback
         self.font = load_font()
         self.font_italic = load_italic_font()
+        self._font_cache: Dict[Tuple[bool, int], ImageFont.FreeTypeFont] = {}
+        self._layout_cache: Dict[Tuple[int, int, int], Tuple[dict, dict]] = {}
 
         # Set up logger
         self.logger = logger or get_logger("thumbr")
 
+        # Pillow-SIMD is API-compatible and tags its releases with ".post"
+        if ".post" not in PIL.__version__:
+            self.logger.debug(
+                f"Using Pillow {PIL.__version__}; install Pillow-SIMD for "
+                "faster image processing"
+            )
+
         # Retry configuration
         self.max_retries = 3
         self.retry_delay = 1.0  # seconds
 
+    def _sized_font(self, italic: bool, size: int) -> ImageFont.FreeTypeFont:
+        """Get a cached copy of the regular or italic font at the given size.
+
+        Args:
+            italic: If True, use the italic font.
+            size: Font size in pixels.
+
+        Returns:
+            Font instance at the requested size.
+        """
+        key = (italic, size)
+        font = self._font_cache.get(key)
+        if font is None:
+            base_font = self.font_italic if italic else self.font
+            font = base_font.font_variant(size=size)
+            self._font_cache[key] = font
+        return font
+
     def _retry_on_failure(self, func: Callable, *args, **kwargs) -> Any:
         """Execute a function with retry logic for transient failures.
 
@@ -129,28 +210,51 @@ class Thumbr:
 
         raise last_exception
 
-    def get_video_info_and_frames(
-        self, video_path: str, progress_callback: Optional[Callable[[str], None]] = None
-    ) -> Tuple[dict, List[np.ndarray]]:
-        """Get video information and capture frames in a single video open.
+    def _create_hwaccel(self):
+        """Create PyAV hardware decoding settings for the configured device.
 
-        This method combines get_video_info() and capture_frames() to open
-        the video only once, improving performance.
+        Requires PyAV 14+ built against an FFmpeg with the device enabled.
+
+        Returns:
+            av.codec.hwaccel.HWAccel instance.
+        """
+        from av.codec.hwaccel import HWAccel, hwdevices_available
+
+        device_type = self.hwaccel
+        if device_type == "auto":
+            available = hwdevices_available()
+            if not available:
+                raise ValueError("No hardware decoding devices available")
+            device_type = available[0]
+
+        return HWAccel(device_type=device_type, allow_software_fallback=True)
+
+    def _open_and_probe(self, video_path: str) -> Tuple[Any, dict]:
+        """Open a video and read its information from the container.
+
+        The caller is responsible for closing the returned container.
 
         Args:
             video_path: Path to the video file.
-            progress_callback: Optional callback for progress updates.
 
         Returns:
-            Tuple of (video_info dict, list of captured frames).
+            Tuple of (open PyAV container, video_info dict).
         """
-        if progress_callback:
-            progress_callback("Opening video")
+        container = None
+        if self.hwaccel:
+            try:
+                container = av.open(video_path, hwaccel=self._create_hwaccel())
+            except Exception as e:
+                self.logger.debug(
+                    f"Hardware decoding unavailable for {video_path}: {e}. "
+                    "Falling back to software decoding"
+                )
 
-        try:
-            container = av.open(video_path)
-        except Exception as e:
-            raise ValueError(f"Could not open video file: {video_path}: {e}")
+        if container is None:
+            try:
+                container = av.open(video_path)
+            except Exception as e:
+                raise ValueError(f"Could not open video file: {video_path}: {e}")
 
         try:
             stream = container.streams.video[0]
@@ -161,7 +265,16 @@ class Thumbr:
             frame_count = stream.frames or 0
 
             if frame_count == 0:
-                frame_count = int(container.duration * stream.time_base * fps)
+                # Containers such as MKV, WebM and TS carry no frame count.
+                # Estimate it from the stream duration (stream time base) or
+                # the container duration (av.time_base units)
+                if stream.duration:
+                    duration_sec = float(stream.duration * stream.time_base)
+                elif container.duration:
+                    duration_sec = container.duration / av.time_base
+                else:
+                    duration_sec = 0
+                frame_count = int(duration_sec * fps)
 
             duration = frame_count / fps if fps > 0 and frame_count > 0 else 0
             file_size = os.path.getsize(video_path)
@@ -175,47 +288,55 @@ class Thumbr:
                 "file_size": file_size,
                 "filename": os.path.basename(video_path),
             }
+        except Exception:
+            container.close()
+            raise
+
+        return container, video_info
+
+    def get_video_info_and_frames(
+        self,
+        video_path: str,
+        progress_callback: Optional[Callable[[str], None]] = None,
+        max_width: Optional[int] = None,
+    ) -> Tuple[dict, List[np.ndarray]]:
+        """Get video information and capture frames in a single video open.
+
+        This method combines get_video_info() and capture_frames() to open
+        the video only once, improving performance. When resizing at capture
+        is enabled, frames are decoded directly at the grid tile size.
+
+        Args:
+            video_path: Path to the video file.
+            progress_callback: Optional callback for progress updates.
+            max_width: Maximum width of the output image, used to size the
+                       captured frames. Default from instance.
 
+        Returns:
+            Tuple of (video_info dict, list of captured frames).
+        """
+        if progress_callback:
+            progress_callback("Opening video")
+
+        container, video_info = self._open_and_probe(video_path)
+
+        try:
             if progress_callback:
                 progress_callback("Capturing frames")
 
-            frames = []
-            interval = frame_count // (self.total_frames + 1) if frame_count > 0 else 1
-
             target_width = None
             target_height = None
-            if self.resize_frames_at_capture:
-                aspect_ratio = width / height if height > 0 else 1.0
-                if width > height:
-                    target_width = self.max_resize_dimension
-                    target_height = int(target_width / aspect_ratio)
-                else:
-                    target_height = self.max_resize_dimension
-                    target_width = int(target_height * aspect_ratio)
-
-            for i in range(self.total_frames):
-                target_frame_num = (i + 1) * interval
-
-                try:
-                    # Calculate timestamp in stream timebase units
-                    # timestamp_seconds = frame_number / fps
-                    # timestamp_stream_units = timestamp_seconds / time_base
-                    timestamp_sec = target_frame_num / fps if fps > 0 else 0
-                    timestamp_ts = int(timestamp_sec / float(stream.time_base))
-
-                    container.seek(timestamp_ts)
-                    for frame in container.decode(video=0):
-                        frame_rgb = frame.to_ndarray(format="rgb24")
-
-                        if target_width and target_height:
-                            frame_rgb = self._resize_frame(
-                                frame_rgb, target_width, target_height
-                            )
-
-                        frames.append(frame_rgb)
-                        break
-                except Exception:
-                    continue
+            if self.resize_frames_at_capture and video_info["height"] > 0:
+                dimensions, _ = self._layout(video_info, max_width or self.max_width)
+                target_width = dimensions["frame_width"]
+                target_height = dimensions["frame_height"]
+
+            frames = [
+                frame
+                for _, _, frame in self._iter_sample_frames(
+                    container, video_info, target_width, target_height
+                )
+            ]
 
             return video_info, frames
 
@@ -234,36 +355,9 @@ class Thumbr:
         Returns:
             Dictionary containing video information.
         """
-        try:
-            container = av.open(video_path)
-        except Exception as e:
-            raise ValueError(f"Could not open video file: {video_path}: {e}")
-
-        try:
-            stream = container.streams.video[0]
-
-            width = stream.width
-            height = stream.height
-            fps = float(stream.average_rate) if stream.average_rate else 24.0
-            frame_count = stream.frames or 0
-
-            if frame_count == 0:
-                frame_count = int(container.duration * stream.time_base * fps)
-
-            duration = frame_count / fps if fps > 0 and frame_count > 0 else 0
-            file_size = os.path.getsize(video_path)
-
-            return {
-                "width": width,
-                "height": height,
-                "fps": fps,
-                "frame_count": frame_count,
-                "duration": duration,
-                "file_size": file_size,
-                "filename": os.path.basename(video_path),
-            }
-        finally:
-            container.close()
+        container, video_info = self._open_and_probe(video_path)
+        container.close()
+        return video_info
 
     def capture_frames(self, video_path: str) -> List[np.ndarray]:
         """Capture evenly distributed frames from the video.
@@ -277,105 +371,268 @@ class Thumbr:
         Returns:
             List of captured frames as numpy arrays.
         """
-        try:
-            container = av.open(video_path)
-        except Exception as e:
-            raise ValueError(f"Could not open video file: {video_path}: {e}")
+        container, video_info = self._open_and_probe(video_path)
 
         try:
-            stream = container.streams.video[0]
-            frame_count = stream.frames or 0
-
-            if frame_count == 0:
-                fps = float(stream.average_rate) if stream.average_rate else 24.0
-                frame_count = int(container.duration * stream.time_base * fps)
-
-            interval = frame_count // (self.total_frames + 1) if frame_count > 0 else 1
+            width = video_info["width"]
+            height = video_info["height"]
 
             target_width = None
             target_height = None
             if self.resize_frames_at_capture:
-                aspect_ratio = (
-                    stream.width / stream.height if stream.height > 0 else 1.0
-                )
-                if stream.width > stream.height:
+                aspect_ratio = width / height if height > 0 else 1.0
+                if width > height:
                     target_width = self.max_resize_dimension
                     target_height = int(target_width / aspect_ratio)
                 else:
                     target_height = self.max_resize_dimension
                     target_width = int(target_height * aspect_ratio)
 
-            frames = []
+            return [
+                frame
+                for _, _, frame in self._iter_sample_frames(
+                    container, video_info, target_width, target_height
+                )
+            ]
+        finally:
+            container.close()
 
-            for i in range(self.total_frames):
-                target_frame_num = (i + 1) * interval
+    def _iter_sample_frames(
+        self,
+        container,
+        video_info: dict,
+        target_width: Optional[int] = None,
+        target_height: Optional[int] = None,
+    ) -> Iterator[Tuple[int, float, np.ndarray]]:
+        """Decode the evenly spaced sample frames from an open container.
+
+        Densely spaced samples are collected in a single forward pass over
+        the stream, converting only the target frames to RGB. When samples
+        are further apart than the estimated GOP length, each target is
+        reached by seeking to its preceding keyframe and decoding forward.
+        Target frames are scaled by swscale as part of the RGB conversion, so
+        full-resolution RGB frames are never materialized when resizing.
+
+        Args:
+            container: Open PyAV input container.
+            video_info: Video information from _open_and_probe().
+            target_width: Optional width to resize captured frames to.
+            target_height: Optional height to resize captured frames to.
+
+        Yields:
+            Tuples of (grid index, timestamp in seconds, frame as numpy array).
+        """
+        stream = container.streams.video[0]
+        # Let FFmpeg decode with frame and slice threads
+        stream.thread_type = "AUTO"
+        stream.thread_count = self.decode_threads
+
+        fps = video_info["fps"]
+        frame_count = video_info["frame_count"]
+        interval = frame_count // (self.total_frames + 1) if frame_count > 0 else 1
+        targets = [(i + 1) * interval for i in range(self.total_frames)]
+        frame_interval = video_info["duration"] / (self.total_frames + 1)
+
+        def to_rgb(frame) -> np.ndarray:
+            # Area averaging is both the cheapest and the best-looking
+            # swscale filter for the large downscales used here
+            return frame.to_ndarray(
+                width=target_width,
+                height=target_height,
+                format="rgb24",
+                interpolation="AREA",
+            )
+
+        time_base = float(stream.time_base)
+        start_time = stream.start_time or 0
+
+        def decode_at(target_pts: int, keyframe_only: bool):
+            # The seek lands on the preceding keyframe. Either take that
+            # keyframe, skipping all other frames in the decoder, or
+            # decode forward to the exact target
+            stream.codec_context.skip_frame = "NONKEY" if keyframe_only else "DEFAULT"
+
+            # Containers without a seek index (e.g. MPEG-TS) can land past
+            # the target, so seek further back until the first frame is at
+            # or before it
+            seek_pts = target_pts
+            step = max(int(1 / time_base), 1)
+            while True:
+                container.seek(seek_pts, stream=stream)
+                frames = container.decode(stream)
+                frame = next(frames, None)
+                if (
+                    frame is None
+                    or frame.pts is None
+                    or frame.pts <= target_pts
+                    or seek_pts <= start_time
+                ):
+                    break
+                seek_pts = max(seek_pts - step, start_time)
+                step *= 2
+
+            if keyframe_only or frame is None or frame.pts is None:
+                return frame
+            for frame in itertools.chain((frame,), frames):
+                if frame.pts is None or frame.pts >= target_pts:
+                    return frame
+            return None
+
+        # Estimate GOP length as two seconds of video
+        gop_estimate = fps * 2
+        idx = 0
+
+        if interval > gop_estimate and not stream.frames:
+            # The frame count was estimated from the duration. Make sure the
+            # last target exists before sampling, so a bad estimate cannot
+            # send the seeks past the end of the stream
+            last_target_pts = start_time + int(targets[-1] / fps / time_base)
+            if decode_at(last_target_pts, False) is None:
+                # Count the frames from the packets, which needs no decoding
+                container.seek(start_time, stream=stream)
+                frame_count = sum(1 for packet in container.demux(stream) if packet.size)
+                self.logger.warning(
+                    f"Estimated frame count {video_info['frame_count']} is past "
+                    f"the end of the video, using {frame_count} counted frames"
+                )
+                interval = (
+                    frame_count // (self.total_frames + 1) if frame_count > 0 else 1
+                )
+                targets = [(i + 1) * interval for i in range(self.total_frames)]
+                frame_interval = frame_count / fps / (self.total_frames + 1)
+            container.seek(start_time, stream=stream)
+
+        if interval > gop_estimate:
+            interval_pts = int(interval / fps / time_base)
+            last_keyframe_pts = None
+
+            for i, target_frame_num in enumerate(targets):
+                frame_rgb = None
+                frame_time = (i + 1) * frame_interval
+
+                # Calculate target timestamp in stream timebase units
+                timestamp_sec = target_frame_num / fps if fps > 0 else 0
+                target_pts = start_time + int(timestamp_sec / time_base)
 
                 try:
-                    # Calculate timestamp in stream timebase units
-                    timestamp_sec = target_frame_num / fps if fps > 0 else 0
-                    timestamp_ts = int(timestamp_sec / float(stream.time_base))
-
-                    container.seek(timestamp_ts)
-                    for frame in container.decode(video=0):
-                        frame_rgb = frame.to_ndarray(format="rgb24")
-
-                        if target_width and target_height:
-                            frame_rgb = self._resize_frame(
-                                frame_rgb, target_width, target_height
-                            )
-
-                        frames.append(frame_rgb)
-                        break
-                except Exception:
+                    frame = decode_at(target_pts, self.snap_to_keyframes)
+                    if (
+                        self.snap_to_keyframes
+                        and frame is not None
+                        and frame.pts is not None
+                    ):
+                        # Keyframes too sparse for this grid: fall back to
+                        # the exact frame rather than repeating a keyframe
+                        # or showing one far before the target
+                        if (
+                            frame.pts == last_keyframe_pts
+                            or target_pts - frame.pts > interval_pts
+                        ):
+                            frame = decode_at(target_pts, False)
+                        else:
+                            last_keyframe_pts = frame.pts
+                            frame_time = max((frame.pts - start_time) * time_base, 0.0)
+
+                    if frame is not None:
+                        frame_rgb = to_rgb(frame)
+                except Exception as e:
+                    self.logger.debug(
+                        f"Could not decode sample {i + 1} at {timestamp_sec:.2f}s: {e}"
+                    )
                     continue
 
-            return frames
-        finally:
-            container.close()
+                if frame_rgb is None:
+                    self.logger.debug(
+                        f"No frame decoded for sample {i + 1} at {timestamp_sec:.2f}s"
+                    )
+                    continue
 
-    def _resize_frame(self, frame: np.ndarray, width: int, height: int) -> np.ndarray:
-        """Resize a frame using numpy/scipy interpolation."""
-        from scipy.ndimage import zoom
+                yield idx, frame_time, frame_rgb
+                idx += 1
 
-        if frame.shape[0] == height and frame.shape[1] == width:
-            return frame
+            return
 
-        zoom_factors = (height / frame.shape[0], width / frame.shape[1], 1)
-        return zoom(frame, zoom_factors, order=1)
+        try:
+            for frame_num, frame in enumerate(container.decode(stream)):
+                if frame_num < targets[idx]:
+                    continue
+                frame_rgb = to_rgb(frame)
+                first_idx = idx
+                idx += 1
+
+                # Very short videos can repeat a target. Tiles are drawn on
+                # in place by another thread, so every repeat gets its copy
+                # before the original frame is handed out
+                while idx < len(targets) and targets[idx] <= frame_num:
+                    yield idx, (idx + 1) * frame_interval, frame_rgb.copy()
+                    idx += 1
+                yield first_idx, (first_idx + 1) * frame_interval, frame_rgb
+                if idx == len(targets):
+                    break
+        except Exception:
+            pass
+
+    def _iter_frames_in_background(
+        self,
+        container,
+        video_info: dict,
+        target_width: Optional[int] = None,
+        target_height: Optional[int] = None,
+    ) -> Iterator[Tuple[int, float, np.ndarray]]:
+        """Decode sample frames on a background thread.
 
-    def create_info_header(self, video_info: dict, width: int) -> Image.Image:
-        """Create an information header for the thumbnail.
+        Frames are handed over through a small bounded queue so decoding
+        overlaps with the processing of frames already captured.
 
         Args:
-            video_info: Dictionary containing video information.
-            width: Width of the header image.
+            container: Open PyAV input container.
+            video_info: Video information from _open_and_probe().
+            target_width: Optional width to resize captured frames to.
+            target_height: Optional height to resize captured frames to.
 
-        Returns:
-            PIL Image containing the header information.
+        Yields:
+            Tuples of (grid index, timestamp in seconds, frame as numpy array).
         """
-        # Calculate header height based on number of info lines
-        num_lines = 5
-        line_height = 20
-        header_height = num_lines * line_height + 20  # Add padding
-
-        header = Image.new("RGB", (width, header_height), "black")
-        draw = ImageDraw.Draw(header)
+        frame_queue: queue.Queue = queue.Queue(maxsize=4)
+        stop_event = threading.Event()
+        done = object()
 
-        # Use the class font
-        font = self.font
+        def put(item) -> None:
+            while not stop_event.is_set():
+                try:
+                    frame_queue.put(item, timeout=0.1)
+                    return
+                except queue.Full:
+                    continue
 
-        # Create info lines using shared method
-        info_lines = generate_info_text(
-            video_info, include_frame_rate=True, include_codec=False
-        )
+        def produce() -> None:
+            try:
+                for item in self._iter_sample_frames(
+                    container, video_info, target_width, target_height
+                ):
+                    if stop_event.is_set():
+                        return
+                    put(item)
+            except Exception as e:
+                put(e)
+            finally:
+                put(done)
 
-        # Draw each line
-        y_position = 10
-        for line in info_lines:
-            draw.text((10, y_position), line, font=font, fill="white")
-            y_position += line_height
+        decoder = threading.Thread(target=produce, name="thumbr-decoder", daemon=True)
+        decoder.start()
 
-        return header
+        try:
+            while True:
+                item = frame_queue.get()
+                if item is done:
+                    break
+                if isinstance(item, Exception):
+                    raise item
+                yield item
+        finally:
+            # Stop the decoder before the caller closes the container
+            stop_event.set()
+            decoder.join()
 
     def _calculate_dimensions(self, video_info: dict, max_width: int) -> dict:
         """Calculate dimensions for the thumbnail grid."""
@@ -428,69 +685,63 @@ class Thumbr:
             "watermark_padding": watermark_padding,
         }
 
-    def _create_info_section(self, video_info: dict, dimensions: dict) -> Image.Image:
-        """Create the info section of the thumbnail."""
-        grid_width = dimensions["grid_width"]
-        info_height = dimensions["info_height"]
+    def _layout(self, video_info: dict, max_width: int) -> Tuple[dict, dict]:
+        """Get the grid dimensions and timestamp layout for a video size.
+
+        The layout only depends on the output width and the video resolution,
+        so it is computed once per combination and reused across videos.
+
+        Args:
+            video_info: Video information from get_video_info().
+            max_width: Maximum width of the output image.
+
+        Returns:
+            Tuple of (dimensions, timestamp_layout).
+        """
+        key = (max_width, video_info["width"], video_info["height"])
+        layout = self._layout_cache.get(key)
+        if layout is None:
+            dimensions = self._calculate_dimensions(video_info, max_width)
+            layout = (dimensions, self._precompute_timestamp_layout(dimensions))
+            self._layout_cache[key] = layout
+        return layout
+
+    def _draw_info_section(
+        self, image: Image.Image, info_text: List[str], dimensions: dict
+    ) -> None:
+        """Draw the info lines onto the white area at the top of the thumbnail."""
         padding = dimensions["padding"]
         info_font_size = dimensions["info_font_size"]
         line_spacing = dimensions["line_spacing"]
 
-        # Create info section image
-        info_section = Image.new("RGB", (grid_width, info_height), "white")
-        draw = ImageDraw.Draw(info_section)
-
-        info_font = self.font.font_variant(size=info_font_size)
-
-        # Create info text using shared method
-        info_text = generate_info_text(
-            video_info, include_frame_rate=True, include_codec=False
-        )
+        draw = ImageDraw.Draw(image)
+        info_font = self._sized_font(False, info_font_size)
 
         y_position = padding
         for text in info_text:
             draw.text((padding, y_position), text, font=info_font, fill="black")
             y_position += line_spacing
 
-        return info_section
+    def _precompute_timestamp_layout(self, dimensions: dict) -> dict:
+        """Calculate the timestamp font and badge position shared by all frames.
 
-    def _process_frame_with_timestamp(
-        self, frame: np.ndarray, timestamp: float, dimensions: dict
-    ) -> Image.Image:
-        """Process a single frame with timestamp overlay."""
+        All timestamps are formatted as HH:MM:SS with fixed-width digits, so
+        the badge is measured once using a representative string.
+        """
         frame_width = dimensions["frame_width"]
         frame_height = dimensions["frame_height"]
 
-        # Convert frame to PIL Image
-        pil_frame = Image.fromarray(frame)
-        resized_frame = pil_frame.resize(
-            (frame_width, frame_height), Image.Resampling.LANCZOS
-        )
-
-        # Calculate timestamp
-        hours = int(timestamp // 3600)
-        minutes = int((timestamp % 3600) // 60)
-        seconds = int(timestamp % 60)
-        timestamp_text = f"{hours:02d}:{minutes:02d}:{seconds:02d}"
-
         # Create timestamp font
         timestamp_font_size = int(frame_width * 0.06)
-        timestamp_font = self.font.font_variant(size=timestamp_font_size)
-
-        # Create a new image for the frame with timestamp
-        frame_with_timestamp = resized_frame.copy()
-        frame_draw = ImageDraw.Draw(frame_with_timestamp)
+        timestamp_font = self._sized_font(False, timestamp_font_size)
 
         # Calculate timestamp text dimensions
-        timestamp_bbox = frame_draw.textbbox(
-            (0, 0), timestamp_text, font=timestamp_font
-        )
+        timestamp_bbox = timestamp_font.getbbox("00:00:00")
         timestamp_width = timestamp_bbox[2] - timestamp_bbox[0]
         timestamp_height = timestamp_bbox[3] - timestamp_bbox[1]
 
         # Get font metrics for better vertical centering
-        font_metrics = timestamp_font.getmetrics()
-        ascent, descent = font_metrics
+        ascent, descent = timestamp_font.getmetrics()
 
         # Adjust timestamp background and text positioning
         margin = int(frame_width * 0.02)  # 2% of frame width for margin
@@ -515,27 +766,152 @@ class Thumbr:
         bg_right = frame_width - margin
         bg_bottom = frame_height - margin
 
-        # Draw semi-transparent background
-        overlay = Image.new("RGBA", resized_frame.size, (0, 0, 0, 0))
-        overlay_draw = ImageDraw.Draw(overlay)
-        overlay_draw.rectangle(
-            [bg_left, bg_top, bg_right, bg_bottom], fill=(0, 0, 0, 180)
-        )
-        frame_with_timestamp = Image.alpha_composite(
-            frame_with_timestamp.convert("RGBA"), overlay
-        ).convert("RGB")
-
-        # Add timestamp text
-        frame_draw = ImageDraw.Draw(frame_with_timestamp)
         bg_width = bg_right - bg_left
         bg_height = bg_bottom - bg_top
         text_x = bg_left + (bg_width - timestamp_width) // 2
         text_y = bg_top + (bg_height - (ascent + descent)) // 2
-        frame_draw.text(
-            (text_x, text_y), timestamp_text, font=timestamp_font, fill="white"
+
+        return {
+            "font": timestamp_font,
+            "bg_left": bg_left,
+            "bg_top": bg_top,
+            "bg_right": bg_right,
+            "bg_bottom": bg_bottom,
+            "text_x": text_x,
+            "text_y": text_y,
+        }
+
+    def _render_tile(
+        self, frame: np.ndarray, dimensions: dict, timestamp_layout: dict
+    ) -> np.ndarray:
+        """Resize a frame to tile size and darken its timestamp background.
+
+        Works on the numpy frame directly; the timestamp text itself is drawn
+        for all tiles at once by _draw_timestamps().
+        """
+        frame_width = dimensions["frame_width"]
+        frame_height = dimensions["frame_height"]
+
+        # Resize only if the frame was not already captured at tile size.
+        # reducing_gap first box-reduces by an integer factor, leaving a
+        # small bilinear pass that looks the same as LANCZOS at tile size.
+        if frame.shape[:2] != (frame_height, frame_width):
+            frame = np.array(
+                Image.fromarray(frame).resize(
+                    (frame_width, frame_height),
+                    Image.Resampling.BILINEAR,
+                    reducing_gap=2.0,
+                )
+            )
+
+        # Draw semi-transparent background by blending black at 180/255
+        # opacity into the background region only. The remaining
+        # (255 - 180) / 255 of each pixel is approximated as 75 / 256 so the
+        # division becomes a shift.
+        background = frame[
+            timestamp_layout["bg_top"] : timestamp_layout["bg_bottom"] + 1,
+            timestamp_layout["bg_left"] : timestamp_layout["bg_right"] + 1,
+        ]
+        # Widen into a single scratch buffer and write back in place so only
+        # one temporary array is allocated per tile.
+        scratch = np.multiply(background, 75, dtype=np.uint16)
+        np.right_shift(scratch, 8, out=scratch)
+        np.copyto(background, scratch, casting="unsafe")
+
+        return frame
+
+    def _tile_position(self, idx: int, dimensions: dict) -> Tuple[int, int]:
+        """Get the (x, y) position of a grid tile on the thumbnail canvas."""
+        row = idx // self.grid_size[1]
+        col = idx % self.grid_size[1]
+        x = dimensions["padding"] + (
+            col * (dimensions["frame_width"] + dimensions["spacing"])
+        )
+        y = dimensions["info_height"] + (
+            row * (dimensions["frame_height"] + dimensions["spacing"])
         )
+        return x, y
+
+    def _paste_frames(
+        self,
+        canvas: np.ndarray,
+        frame_items: Iterable[Tuple[int, float, np.ndarray]],
+        dimensions: dict,
+        timestamp_layout: dict,
+    ) -> Dict[int, float]:
+        """Render tiles in parallel and copy them into the grid.
 
-        return frame_with_timestamp
+        Frames are submitted to a thread pool as they arrive, so processing
+        overlaps with decoding when frame_items is fed by a decoder thread.
+        Tiles are written into the canvas array on the calling thread.
+
+        Args:
+            canvas: Thumbnail canvas to copy the rendered tiles into.
+            frame_items: Iterable of (grid index, timestamp, frame) tuples.
+            dimensions: Grid dimensions from _calculate_dimensions().
+            timestamp_layout: Badge layout from _precompute_timestamp_layout().
+
+        Returns:
+            Dictionary mapping the grid index of each added tile to its
+            timestamp in seconds.
+        """
+        timestamps = {}
+        max_workers = min(self.total_frames, os.cpu_count() or 1)
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            future_to_idx = {}
+            for idx, timestamp, frame in frame_items:
+                future = executor.submit(
+                    self._render_tile, frame, dimensions, timestamp_layout
+                )
+                future_to_idx[future] = idx
+                timestamps[idx] = timestamp
+
+            for future in as_completed(future_to_idx):
+                idx = future_to_idx[future]
+                tile = future.result()
+
+                # Copy tile into the canvas
+                x, y = self._tile_position(idx, dimensions)
+                canvas[
+                    y : y + dimensions["frame_height"],
+                    x : x + dimensions["frame_width"],
+                ] = tile
+
+                # Explicitly delete rendered tile to free memory
+                del tile
+
+        return timestamps
+
+    def _draw_timestamps(
+        self,
+        image: Image.Image,
+        timestamps: Dict[int, float],
+        dimensions: dict,
+        timestamp_layout: dict,
+    ) -> None:
+        """Draw the timestamp text of every tile onto the thumbnail."""
+        draw = ImageDraw.Draw(image)
+        font = timestamp_layout["font"]
+
+        # Split all timestamps into HH:MM:SS fields at once
+        indices = list(timestamps)
+        total_seconds = np.array([timestamps[idx] for idx in indices], dtype=np.int64)
+        hours, remainder = np.divmod(total_seconds, 3600)
+        minutes, seconds = np.divmod(remainder, 60)
+
+        for idx, hh, mm, ss in zip(
+            indices, hours.tolist(), minutes.tolist(), seconds.tolist()
+        ):
+            timestamp_text = f"{hh:02d}:{mm:02d}:{ss:02d}"
+
+            x, y = self._tile_position(idx, dimensions)
+            draw.text(
+                (x + timestamp_layout["text_x"], y + timestamp_layout["text_y"]),
+                timestamp_text,
+                font=font,
+                fill="white",
+            )
 
     def _add_watermark(self, image: Image.Image, dimensions: dict) -> Image.Image:
         """Add watermark to the image."""
@@ -544,14 +920,15 @@ class Thumbr:
         watermark_padding = dimensions["watermark_padding"]
 
         watermark_text = "Thumbr — Video Thumbnail Generator"
-        watermark_font_size = int(grid_width * 0.015)  # 1.5% of width for small text
 
-        # Create copy of italic font with desired size
-        watermark_font = self.font_italic.font_variant(size=watermark_font_size)
+        # Italic variant of the info font size
+        watermark_font = self._sized_font(True, dimensions["info_font_size"])
 
-        # Create watermark overlay
-        watermark_overlay = Image.new("RGBA", (grid_width, total_height), (0, 0, 0, 0))
-        watermark_draw = ImageDraw.Draw(watermark_overlay)
+        # The watermark sits on the white background below the grid, so the
+        # black text at 153/255 opacity can be drawn directly in its
+        # pre-blended gray instead of compositing a full-canvas overlay
+        watermark_gray = 255 - 153
+        watermark_draw = ImageDraw.Draw(image)
 
         # Calculate watermark position
         watermark_bbox = watermark_draw.textbbox(
@@ -565,90 +942,127 @@ class Thumbr:
             total_height - watermark_height - watermark_padding
         )  # Bottom position
 
-        # Draw watermark with 40% opacity
         watermark_draw.text(
             (watermark_x, watermark_y),
             watermark_text,
             font=watermark_font,
-            fill=(0, 0, 0, 153),  # Black with 40% opacity
+            fill=(watermark_gray, watermark_gray, watermark_gray),
         )
 
-        # Composite watermark onto final image
-        final_image = Image.alpha_composite(
-            image.convert("RGBA"), watermark_overlay
-        ).convert("RGB")
+        return image
 
-        return final_image
+    def _save_image(self, image: Image.Image, output_path: str) -> None:
+        """Save the thumbnail, using fast JPEG encoder settings for JPEG files."""
+        output_lower = output_path.lower()
+        if output_lower.endswith((".jpg", ".jpeg")):
+            # 4:2:0 chroma subsampling with no extra optimization passes
+            image.save(
+                output_path,
+                "JPEG",
+                quality=self.jpeg_quality,
+                subsampling=2,
+                optimize=False,
+                progressive=False,
+            )
+        else:
+            image.save(output_path)
 
-    def _generate_thumbnail_no_progress(
+    def _render_thumbnail(
         self,
         video_path: str,
         output_path: str = None,
         max_width: int = None,
         use_combined_capture: bool = True,
+        progress_callback: Optional[Callable[[str], None]] = None,
     ) -> str:
-        """Generate thumbnail without progress bar (non-verbose mode)."""
+        """Generate the thumbnail, reporting each step to progress_callback.
+
+        With combined capture, the video is opened once and frames are
+        decoded on a background thread while earlier frames are processed.
+        """
         max_width = max_width or self.max_width
 
+        def report(step: int) -> None:
+            if progress_callback:
+                progress_callback(THUMBNAIL_STEPS[step])
+
+        report(0)
         if use_combined_capture:
-            video_info, frames = self.get_video_info_and_frames(video_path)
+            container, video_info = self._open_and_probe(video_path)
         else:
+            container = None
             video_info = self.get_video_info(video_path)
-            frames = self.capture_frames(video_path)
 
-        if not frames:
-            raise ValueError("No frames could be captured from the video")
+        frame_items = None
+        try:
+            # If no output path specified, generate one in output/ directory
+            if output_path is None:
+                output_dir = Path("output")
+                output_dir.mkdir(parents=True, exist_ok=True)
+                safe_filename = _safe_filename(video_path)
+                output_path = str(output_dir / f"{safe_filename}_thumbnail.jpg")
 
-        if output_path is None:
-            output_dir = Path("output")
-            output_dir.mkdir(parents=True, exist_ok=True)
-            video_filename = Path(video_path).stem
-            safe_filename = "".join(
-                c if c.isalnum() or c == "_" else "_"
-                for c in video_filename.replace(" ", "_")
-            )
-            output_path = str(output_dir / f"{safe_filename}_thumbnail.jpg")
+            report(1)
+            dimensions, timestamp_layout = self._layout(video_info, max_width)
 
-        dimensions = self._calculate_dimensions(video_info, max_width)
-        info_section = self._create_info_section(video_info, dimensions)
+            # Create the final canvas with white background
+            grid_width = dimensions["grid_width"]
+            total_height = dimensions["total_height"]
+            canvas = np.full((total_height, grid_width, 3), 255, dtype=np.uint8)
+
+            # Capture frames and process them with timestamps
+            report(2)
+            if container is not None:
+                target_width = None
+                target_height = None
+                if self.resize_frames_at_capture:
+                    target_width = dimensions["frame_width"]
+                    target_height = dimensions["frame_height"]
+                frame_items = self._iter_frames_in_background(
+                    container, video_info, target_width, target_height
+                )
+            else:
+                frames = self.capture_frames(video_path)
+                frame_interval = video_info["duration"] / (self.total_frames + 1)
+                frame_items = (
+                    (idx, (idx + 1) * frame_interval, frame)
+                    for idx, frame in enumerate(frames)
+                )
+                del frames
 
-        grid_width = dimensions["grid_width"]
-        total_height = dimensions["total_height"]
-        final_image = Image.new("RGB", (grid_width, total_height), "white")
-        final_image.paste(info_section, (0, 0))
+            timestamps = self._paste_frames(
+                canvas, frame_items, dimensions, timestamp_layout
+            )
+        finally:
+            if container is not None:
+                # Stop the decoder thread before closing its container
+                if frame_items is not None:
+                    frame_items.close()
+                container.close()
 
-        frames_start_y = dimensions["info_height"]
-        total_duration = video_info["duration"]
-        frame_interval = total_duration / (self.total_frames + 1)
+        if not timestamps:
+            raise ValueError("No frames could be captured from the video")
 
-        for idx, frame in enumerate(frames):
-            timestamp = (idx + 1) * frame_interval
-            frame_with_timestamp = self._process_frame_with_timestamp(
-                frame, timestamp, dimensions
-            )
+        final_image = Image.fromarray(canvas)
+        del canvas
 
-            row = idx // self.grid_size[1]
-            col = idx % self.grid_size[1]
-            x = dimensions["padding"] + (
-                col * (dimensions["frame_width"] + dimensions["spacing"])
-            )
-            y = frames_start_y + (
-                row * (dimensions["frame_height"] + dimensions["spacing"])
-            )
-            final_image.paste(frame_with_timestamp, (x, y))
-            del frame_with_timestamp
+        self._draw_timestamps(final_image, timestamps, dimensions, timestamp_layout)
 
-        del frames
+        report(3)
+        info_text = generate_info_text(
+            video_info, include_frame_rate=True, include_codec=False
+        )
+        self._draw_info_section(final_image, info_text, dimensions)
 
+        report(4)
         final_image = self._add_watermark(final_image, dimensions)
 
-        output_lower = output_path.lower()
-        if output_lower.endswith((".jpg", ".jpeg")):
-            final_image.save(output_path, quality=50)
-        else:
-            final_image.save(output_path)
+        report(5)
+        self._save_image(final_image, output_path)
 
+        # Explicitly clean up
         del final_image
+
         if self.verbose:
             self.logger.info(f"Thumbnail saved: {output_path}")
         return output_path
@@ -671,121 +1085,30 @@ class Thumbr:
         Returns:
             Path to the generated thumbnail.
         """
-        max_width = max_width or self.max_width
-
         # Only show detailed progress in verbose mode
         show_progress = getattr(self, "verbose", False)
 
         if not show_progress:
             # Non-verbose: do the work without progress bar
-            return self._generate_thumbnail_no_progress(
+            return self._render_thumbnail(
                 video_path, output_path, max_width, use_combined_capture
             )
 
-        # Define the steps for progress tracking
-        steps = [
-            "Getting video information",
-            "Capturing frames",
-            "Calculating dimensions",
-            "Creating info section",
-            "Processing frames with timestamps",
-            "Adding watermark",
-            "Saving thumbnail",
-        ]
-
-        with tqdm(total=len(steps), desc="Generating thumbnail", unit="step") as pbar:
-            # Get video info and frames (combined for performance)
-            pbar.set_postfix_str(steps[0])
-            if use_combined_capture:
-                video_info, frames = self.get_video_info_and_frames(video_path)
-            else:
-                video_info = self.get_video_info(video_path)
-                frames = self.capture_frames(video_path)
-            pbar.update(2)  # Update by 2 since we did info + frames
-
-            if not frames:
-                raise ValueError("No frames could be captured from the video")
-
-            # If no output path specified, generate one in output/ directory
-            if output_path is None:
-                output_dir = Path("output")
-                output_dir.mkdir(parents=True, exist_ok=True)
-                video_filename = Path(video_path).stem
-                # Replace spaces with underscores and remove any special characters
-                safe_filename = "".join(
-                    c if c.isalnum() or c == "_" else "_"
-                    for c in video_filename.replace(" ", "_")
-                )
-                output_path = str(output_dir / f"{safe_filename}_thumbnail.jpg")
-
-            pbar.set_postfix_str(steps[2])
-            dimensions = self._calculate_dimensions(video_info, max_width)
-            pbar.update(1)
-
-            pbar.set_postfix_str(steps[3])
-            info_section = self._create_info_section(video_info, dimensions)
-            pbar.update(1)
-
-            # Create the final image with white background
-            grid_width = dimensions["grid_width"]
-            total_height = dimensions["total_height"]
-            final_image = Image.new("RGB", (grid_width, total_height), "white")
-
-            # Paste info section at the top
-            final_image.paste(info_section, (0, 0))
-
-            # Calculate starting y position for frames
-            frames_start_y = dimensions["info_height"]
-
-            # Process frames with timestamps
-            total_duration = video_info["duration"]
-            frame_interval = total_duration / (self.total_frames + 1)
+        with tqdm(
+            total=len(THUMBNAIL_STEPS), desc="Generating thumbnail", unit="step"
+        ) as pbar:
 
-            pbar.set_postfix_str(steps[4])
-            for idx, frame in enumerate(frames):
-                # Calculate timestamp for this frame
-                timestamp = (idx + 1) * frame_interval
-
-                # Process frame with timestamp
-                frame_with_timestamp = self._process_frame_with_timestamp(
-                    frame, timestamp, dimensions
-                )
-
-                # Calculate position and paste frame
-                row = idx // self.grid_size[1]
-                col = idx % self.grid_size[1]
-                x = dimensions["padding"] + (
-                    col * (dimensions["frame_width"] + dimensions["spacing"])
-                )
-                y = frames_start_y + (
-                    row * (dimensions["frame_height"] + dimensions["spacing"])
-                )
-                final_image.paste(frame_with_timestamp, (x, y))
+            def advance(step: str) -> None:
+                # Each new step marks the previous one as complete
+                if pbar.postfix:
+                    pbar.update(1)
+                pbar.set_postfix_str(step)
 
-                # Explicitly delete processed frame to free memory
-                del frame_with_timestamp
-
-            # Clear frames list to free memory
-            del frames
-            pbar.update(1)
-
-            pbar.set_postfix_str(steps[5])
-            final_image = self._add_watermark(final_image, dimensions)
-            pbar.update(1)
-
-            pbar.set_postfix_str(steps[6])
-            # Apply JPEG compression quality only for JPEG files
-            output_lower = output_path.lower()
-            if output_lower.endswith((".jpg", ".jpeg")):
-                final_image.save(output_path, quality=50)
-            else:
-                final_image.save(output_path)
-
-            # Explicitly clean up
-            del final_image
+            output_path = self._render_thumbnail(
+                video_path, output_path, max_width, use_combined_capture, advance
+            )
             pbar.update(1)
 
-        self.logger.info(f"Thumbnail saved: {output_path}")
         return output_path
 
     def generate_thumbnail_safe(
@@ -817,11 +1140,7 @@ class Thumbr:
         if output_path is None:
             output_dir = Path("output")
             output_dir.mkdir(parents=True, exist_ok=True)
-            video_filename = Path(video_path).stem
-            safe_filename = "".join(
-                c if c.isalnum() or c == "_" else "_"
-                for c in video_filename.replace(" ", "_")
-            )
+            safe_filename = _safe_filename(video_path)
             output_path = str(output_dir / f"{safe_filename}_thumbnail.jpg")
 
         # Check for existing output
@@ -849,6 +1168,61 @@ class Thumbr:
                 video_path=video_path, output_path=None, success=False, error=str(e)
             )
 
+    def _settings(self) -> Dict[str, Any]:
+        """Get the constructor arguments needed to rebuild this instance.
+
+        Used to configure Thumbr instances in worker processes, which cannot
+        share this instance's logger, fonts or decoders.
+        """
+        return {
+            "grid_size": self.grid_size,
+            "max_width": self.max_width,
+            "resize_frames_at_capture": self.resize_frames_at_capture,
+            "max_resize_dimension": self.max_resize_dimension,
+            "verbose": self.verbose,
+            "hwaccel": self.hwaccel,
+            "jpeg_quality": self.jpeg_quality,
+            "decode_threads": self.decode_threads,
+            "snap_to_keyframes": self.snap_to_keyframes,
+        }
+
+    def generate_thumbnails(
+        self,
+        video_paths: List[str],
+        output_dir: Optional[str] = None,
+        max_workers: Optional[int] = None,
+    ) -> List[ThumbnailResult]:
+        """Generate thumbnails for several videos in parallel worker processes.
+
+        Each worker builds its own Thumbr with all of this instance's
+        settings, so no decoder or font objects are shared between processes.
+
+        Args:
+            video_paths: Paths to the video files.
+            output_dir: Optional directory for the thumbnails. If None, uses
+                        the output/ directory.
+            max_workers: Number of worker processes. If None, uses CPU count.
+
+        Returns:
+            List of ThumbnailResult in the same order as video_paths.
+        """
+        if output_dir is not None:
+            Path(output_dir).mkdir(parents=True, exist_ok=True)
+
+        settings = self._settings()
+        work_items = []
+        for video_path in video_paths:
+            output_path = None
+            if output_dir is not None:
+                safe_filename = _safe_filename(video_path)
+                output_path = str(Path(output_dir) / f"{safe_filename}_thumbnail.jpg")
+            work_items.append(
+                (video_path, output_path, False, self.logger.level, settings)
+            )
+
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            return list(executor.map(_process_single_video, work_items))
+
 
 def _process_single_video(args: Tuple) -> ThumbnailResult:
     """Worker function for parallel processing.
@@ -856,21 +1230,15 @@ def _process_single_video(args: Tuple) -> ThumbnailResult:
     This is a module-level function to allow pickling for ProcessPoolExecutor.
 
     Args:
-        args: Tuple of (video_path, output_path, grid_size, max_width,
-                       skip_existing, logger_level, verbose)
+        args: Tuple of (video_path, output_path, skip_existing, logger_level,
+                       settings), where settings is a dict of Thumbr
+                       constructor arguments.
 
     Returns:
         ThumbnailResult for the processed video.
     """
-    (
-        video_path,
-        output_path,
-        grid_size,
-        max_width,
-        skip_existing,
-        logger_level,
-        verbose,
-    ) = args
+    video_path, output_path, skip_existing, logger_level, settings = args
+    verbose = settings.get("verbose", False)
 
     # Suppress FFmpeg/OpenCV warnings in workers unless verbose mode
     import os
@@ -892,9 +1260,7 @@ def _process_single_video(args: Tuple) -> ThumbnailResult:
         logger.addHandler(handler)
 
     # Create Thumbr instance
-    thumbr = Thumbr(
-        grid_size=grid_size, max_width=max_width, logger=logger, verbose=verbose
-    )
+    thumbr = Thumbr(logger=logger, **settings)
 
     # Check for shutdown
     if is_shutdown_requested():
@@ -906,7 +1272,7 @@ def _process_single_video(args: Tuple) -> ThumbnailResult:
         )
 
     return thumbr.generate_thumbnail_safe(
-        video_path, output_path, max_width, skip_existing
+        video_path, output_path, skip_existing=skip_existing
     )
 
 
@@ -1016,6 +1382,9 @@ class BatchProcessor:
         skip_existing: bool = False,
         logger: Optional[logging.Logger] = None,
         verbose: bool = False,
+        hwaccel: Optional[str] = None,
+        jpeg_quality: int = 50,
+        decode_threads: int = 0,
     ):
         """Initialize batch processor.
 
@@ -1026,6 +1395,10 @@ class BatchProcessor:
             skip_existing: Skip videos that already have thumbnails.
             logger: Logger instance.
             verbose: If True, show FFmpeg/OpenCV warnings.
+            hwaccel: Optional hardware decoding device type, or "auto".
+            jpeg_quality: JPEG quality used when saving thumbnails.
+            decode_threads: FFmpeg decoder threads per video. 0 lets FFmpeg
+                            pick; lower it when running several workers.
         """
         import multiprocessing
         import logging
@@ -1035,6 +1408,9 @@ class BatchProcessor:
         self.skip_existing = skip_existing
         self.logger = logger or get_logger("thumbr")
         self.verbose = verbose
+        self.hwaccel = hwaccel
+        self.jpeg_quality = jpeg_quality
+        self.decode_threads = decode_threads
 
         # Determine worker count (max 5 concurrent items)
         if workers is None:
@@ -1046,6 +1422,17 @@ class BatchProcessor:
 
         self._batch_output_dir: Optional[str] = None
 
+    def _thumbr_settings(self) -> Dict[str, Any]:
+        """Get the Thumbr constructor arguments for this batch."""
+        return {
+            "grid_size": self.grid_size,
+            "max_width": self.max_width,
+            "verbose": self.verbose,
+            "hwaccel": self.hwaccel,
+            "jpeg_quality": self.jpeg_quality,
+            "decode_threads": self.decode_threads,
+        }
+
     def process_path(
         self,
         path: str,
@@ -1098,7 +1485,7 @@ class BatchProcessor:
             # Single-threaded processing
             results = self._process_sequential(videos, output_dir)
         else:
-            # Multi-threaded processing
+            # Multi-process processing
             results = self._process_parallel(videos, output_dir, self.verbose)
 
         return results
@@ -1109,12 +1496,7 @@ class BatchProcessor:
         """Process videos sequentially."""
         import logging
 
-        thumbr = Thumbr(
-            grid_size=self.grid_size,
-            max_width=self.max_width,
-            logger=self.logger,
-            verbose=self.verbose,
-        )
+        thumbr = Thumbr(logger=self.logger, **self._thumbr_settings())
 
         results = []
 
@@ -1148,7 +1530,11 @@ class BatchProcessor:
     def _process_parallel(
         self, videos: List[str], output_dir: Optional[str], verbose: bool = False
     ) -> List[ThumbnailResult]:
-        """Process videos in parallel."""
+        """Process videos in parallel, one worker process per video.
+
+        Decoding and image processing are CPU-bound, so separate processes
+        scale with the number of cores instead of contending for the GIL.
+        """
         import logging
         import multiprocessing
 
@@ -1156,19 +1542,13 @@ class BatchProcessor:
         logger_level = self.logger.level
 
         # Prepare arguments for workers
+        settings = self._thumbr_settings()
+        settings["verbose"] = verbose
         work_items = []
         for video_path in videos:
             output_path = self._get_output_path(video_path, output_dir)
             work_items.append(
-                (
-                    video_path,
-                    output_path,
-                    self.grid_size,
-                    self.max_width,
-                    self.skip_existing,
-                    logger_level,
-                    verbose,
-                )
+                (video_path, output_path, self.skip_existing, logger_level, settings)
             )
 
         results = []
@@ -1180,8 +1560,8 @@ class BatchProcessor:
         )
         progress.print_header()
 
-        # Use ThreadPoolExecutor for parallel processing
-        with ThreadPoolExecutor(max_workers=self.workers) as executor:
+        # Use ProcessPoolExecutor for parallel processing
+        with ProcessPoolExecutor(max_workers=self.workers) as executor:
             # Submit all tasks
             future_to_video = {
                 executor.submit(_process_single_video, item): item[0]
@@ -1232,11 +1612,7 @@ class BatchProcessor:
         # Ensure output directory exists
         Path(use_dir).mkdir(parents=True, exist_ok=True)
 
-        video_filename = Path(video_path).stem
-        safe_filename = "".join(
-            c if c.isalnum() or c == "_" else "_"
-            for c in video_filename.replace(" ", "_")
-        )
+        safe_filename = _safe_filename(video_path)
 
         return str(Path(use_dir) / f"{safe_filename}_thumbnail.jpg")
 
@@ -1252,6 +1628,9 @@ def process_batch(
     output_dir: Optional[str] = None,
     logger: Optional[logging.Logger] = None,
     verbose: bool = False,
+    hwaccel: Optional[str] = None,
+    jpeg_quality: int = 50,
+    decode_threads: int = 0,
 ) -> Dict[str, Any]:
     """Convenience function to process a batch of videos.
 
@@ -1266,6 +1645,9 @@ def process_batch(
         output_dir: Output directory.
         logger: Logger instance.
         verbose: If True, show FFmpeg/OpenCV warnings.
+        hwaccel: Optional hardware decoding device type, or "auto".
+        jpeg_quality: JPEG quality used when saving thumbnails.
+        decode_threads: FFmpeg decoder threads per video (0 for automatic).
 
     Returns:
         Dictionary with processing statistics.
@@ -1279,6 +1661,9 @@ def process_batch(
         skip_existing=skip_existing,
         logger=logger,
         verbose=verbose,
+        hwaccel=hwaccel,
+        jpeg_quality=jpeg_quality,
+        decode_threads=decode_threads,
     )
 
     results = processor.process_path(
@@ -1,7 +1,9 @@
+import functools
 import logging
+import math
 import os
 from pathlib import Path
-from typing import List, Optional, Set
+from typing import List, Optional, Set, Tuple
 from PIL import ImageFont
 
 try:
@@ -277,45 +279,53 @@ def validate_video_file(
     return True, ""
 
 
+@functools.lru_cache(maxsize=8)
+def _load_first_font(font_names: Tuple[str, ...], size: int) -> ImageFont.FreeTypeFont:
+    """Load the first available font, caching the result across calls.
+
+    Args:
+        font_names: Font file names to try, in order of preference.
+        size: Font size in pixels.
+
+    Returns:
+        The first font that could be loaded, or Pillow's default font.
+    """
+    for font_name in font_names:
+        try:
+            return ImageFont.truetype(font_name, size)
+        except (OSError, IOError):
+            continue
+    return ImageFont.load_default()
+
+
 def load_font() -> ImageFont.FreeTypeFont:
     """Load Arial font with fallback to system sans-serif fonts."""
-    font_names = [
+    font_names = (
         "arial.ttf",
         "Arial.ttf",
         "DejaVuSans.ttf",
         "LiberationSans-Regular.ttf",
-    ]
-    for font_name in font_names:
-        try:
-            return ImageFont.truetype(font_name, 16)
-        except (OSError, IOError):
-            continue
-    return ImageFont.load_default()
+    )
+    return _load_first_font(font_names, 16)
 
 
 def load_italic_font() -> ImageFont.FreeTypeFont:
     """Load Arial Italic font with fallback to system sans-serif fonts."""
-    font_names = [
+    font_names = (
         "ariali.ttf",
         "Arial-Italic.ttf",
         "DejaVuSans-Oblique.ttf",
         "LiberationSans-Italic.ttf",
-    ]
-    for font_name in font_names:
-        try:
-            return ImageFont.truetype(font_name, 16)
-        except (OSError, IOError):
-            continue
-    return ImageFont.load_default()
+    )
+    return _load_first_font(font_names, 16)
 
 
 def format_file_size(size_bytes: int) -> str:
     """Format file size in human-readable format."""
-    for unit in ["B", "KB", "MB", "GB", "TB"]:
-        if size_bytes < 1024.0:
-            return f"{size_bytes:.1f} {unit}"
-        size_bytes /= 1024.0
-    return f"{size_bytes:.1f} TB"
+    units = ("B", "KB", "MB", "GB", "TB")
+    # Each unit is 2**10 times the previous one
+    idx = min(int(math.log2(max(size_bytes, 1)) // 10), len(units) - 1)
+    return f"{size_bytes / (1 << (idx * 10)):.1f} {units[idx]}"
 
 
 def format_duration(seconds: float) -> str: